@@ -1,23 +1,34 @@
+import logging
 from flask import Flask
+from flask_compress import Compress
 from app.core.exchange import init_exchange
 from app.config.settings import load_config
+from app.json_provider import ORJSONProvider
 
-def create_app():
-    print("Creating Flask application...")
+logger = logging.getLogger(__name__)
+
+def create_app(skip_exchange=False):
+    logger.info("Creating Flask application")
     
     app = Flask(__name__)
+    app.json = ORJSONProvider(app)
     
     # Load configuration
-    print("Loading configuration...")
+    logger.debug("Loading configuration")
     config = load_config()
     app.config.update(config)
     
-    # Initialize exchange
-    print("Initializing exchange...")
-    init_exchange(app)
+    # Compress JSON responses; OHLCV payloads shrink to a fraction on the wire
+    app.config.setdefault('COMPRESS_MIMETYPES', ['application/json'])
+    app.config.setdefault('COMPRESS_LEVEL', 4)
+    Compress(app)
+    
+    # Register exchange settings; the client itself is built lazily
+    if not skip_exchange:
+        init_exchange(app)
     
     # Register blueprints
-    print("Registering blueprints...")
+    logger.debug("Registering blueprints")
     from app.routes.main import main_bp
     from app.routes.chart import chart_bp
     from app.routes.strategy import strategy_bp
@@ -26,6 +37,7 @@ def create_app():
     app.register_blueprint(chart_bp, url_prefix='/api')
     app.register_blueprint(strategy_bp, url_prefix='/api')
     
-    print(f"Registered routes: {[str(r) for r in app.url_map.iter_rules()]}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Registered routes: %s", [str(r) for r in app.url_map.iter_rules()])
     
     return app
\ No newline at end of file
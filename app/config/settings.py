@@ -1,15 +1,16 @@
+import copy
+import functools
 import yaml
 import os
 from dotenv import load_dotenv
 
-def load_config():
-    load_dotenv()
-    
+@functools.lru_cache(maxsize=1)
+def _read_config_file(path='config.yaml'):
     try:
-        with open('config.yaml') as f:
-            config = yaml.safe_load(f)
+        with open(path) as f:
+            return yaml.safe_load(f)
     except FileNotFoundError:
-        config = {
+        return {
             'binance': {
                 'api_key': '',
                 'api_secret': '',
@@ -23,9 +24,15 @@ def load_config():
                 'max_positions': 5
             }
         }
+
+def load_config():
+    load_dotenv()
+    
+    # The parsed file is cached; hand each caller its own copy to mutate
+    config = copy.deepcopy(_read_config_file())
     
     # Override with environment variables
     config['binance']['api_key'] = os.getenv('BINANCE_API_KEY', config['binance']['api_key'])
     config['binance']['api_secret'] = os.getenv('BINANCE_API_SECRET', config['binance']['api_secret'])
     
-    return config
\ No newline at end of file
+    return config
@@ -1,32 +1,51 @@
 import ccxt
-from flask import current_app
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
 
 _exchange = None
+_exchange_settings = None
+_exchange_lock = threading.Lock()
 
 def init_exchange(app):
-    global _exchange
-    with app.app_context():
-        print("Initializing exchange connection...")
-        config = app.config
-        
-        exchange_config = {
-            'apiKey': config['binance']['api_key'],
-            'secret': config['binance']['api_secret'],
-            'enableRateLimit': True,
-            'options': {
-                'defaultType': 'future'
-            }
+    # Only record the settings; the client is built on first use so app
+    # creation does no exchange setup
+    global _exchange, _exchange_settings
+    with _exchange_lock:
+        _exchange = None
+        _exchange_settings = app.config['binance']
+
+def _build_exchange(settings):
+    logger.info("Initializing exchange connection")
+    
+    exchange_config = {
+        'apiKey': settings['api_key'],
+        'secret': settings['api_secret'],
+        'enableRateLimit': True,
+        'options': {
+            'defaultType': 'future'
         }
-        
-        _exchange = ccxt.binance(exchange_config)
-        
-        if config['binance'].get('testnet', True):
-            print("Setting up testnet mode")
-            _exchange.set_sandbox_mode(True)
-        
-        print("Exchange initialization complete")
+    }
+    
+    exchange = ccxt.binance(exchange_config)
+    
+    if settings.get('testnet', True):
+        logger.info("Setting up testnet mode")
+        exchange.set_sandbox_mode(True)
+    
+    logger.debug("Exchange initialization complete")
+    return exchange
 
 def get_exchange():
+    global _exchange
     if _exchange is None:
-        raise RuntimeError("Exchange not initialized. Call init_exchange first.")
-    return _exchange
\ No newline at end of file
+        with _exchange_lock:
+            if _exchange_settings is None:
+                raise RuntimeError("Exchange not initialized. Call init_exchange first.")
+            if _exchange is None:
+                _exchange = _build_exchange(_exchange_settings)
+    return _exchange
+
+def fetch_ticker(symbol):
+    return get_exchange().fetch_ticker(symbol)
\ No newline at end of file
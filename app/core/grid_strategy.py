@@ -1,3 +1,4 @@
+import numpy as np
 from app.core.exchange import get_exchange, fetch_ticker
 
 class GridStrategy:
@@ -18,11 +19,15 @@ class GridStrategy:
                 upper_price = current_price * 1.1
             
             grid_levels = self.config['trading']['grid_size']
-            step = (upper_price - lower_price) / (grid_levels - 1)
+            prices = np.linspace(lower_price, upper_price, grid_levels)
+            sizes = np.full(grid_levels, float(self.config['trading'].get('position_size', 0.0)))
             
+            # Levels are kept as parallel arrays (struct-of-arrays) rather than
+            # one dict per level; the JSON provider serializes them directly
             return {
                 'current_price': current_price,
-                'grid_levels': [{'price': lower_price + i * step} for i in range(grid_levels)]
+                'prices': prices,
+                'sizes': sizes
             }
         except Exception as e:
             raise Exception(f"Error calculating grid levels: {str(e)}")
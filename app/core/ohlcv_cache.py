@@ -0,0 +1,91 @@
+import logging
+import os
+import tempfile
+import time
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = 'cache'
+
+# Upper bound on closed candles kept per (symbol, timeframe) file
+MAX_CACHED_CANDLES = 5000
+
+# Most candles the exchange returns for a single kline request
+MAX_PAGE_CANDLES = 1500
+
+def _cache_path(symbol, timeframe):
+    return os.path.join(CACHE_DIR, f"{symbol.replace('/', '_')}_{timeframe}.npy")
+
+def _load_cached(path):
+    try:
+        return np.load(path)
+    except (FileNotFoundError, ValueError, OSError):
+        return np.empty((0, 6), dtype=np.float64)
+
+def _store(path, candles):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    # Write to a temp file and rename so concurrent readers never see a partial file
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            np.save(f, candles)
+        os.replace(tmp_path, path)
+    except Exception:
+        os.unlink(tmp_path)
+        raise
+
+def load_or_fetch(exchange, symbol, timeframe, limit):
+    """
+    Return the latest candles, fetching only the ones missing from the disk cache
+
+    Only closed candles are persisted; the still-forming candle is always
+    refetched so the cache never serves a stale close. A candle counts as
+    closed once a newer one exists, since calendar timeframes ('1M') have
+    no fixed length.
+
+    Args:
+        exchange: ccxt exchange instance used for the fetch
+        symbol (str): Market symbol, e.g. 'BTC/USDT'
+        timeframe (str): Exchange timeframe string
+        limit (int): Number of most recent candles to return, capped at
+            MAX_PAGE_CANDLES
+
+    Returns:
+        np.ndarray: (n, 6) float64 array of [timestamp_ms, open, high, low, close, volume]
+    """
+    # One request never yields more than a page, so neither can the cache window
+    limit = min(limit, MAX_PAGE_CANDLES)
+    # Nominal bar length, only used to estimate how many bars are missing
+    bar_ms = exchange.parse_timeframe(timeframe) * 1000
+    now_ms = time.time_ns() // 1_000_000
+    path = _cache_path(symbol, timeframe)
+
+    cached = _load_cached(path)
+    if len(cached):
+        last_ts = int(cached[-1, 0])
+        missing = (now_ms - last_ts) // bar_ms
+        # limit <= MAX_PAGE_CANDLES, so missing < limit keeps the tail within one page;
+        # a longer gap would cut off the newest bars, so refetch instead
+        usable = missing < limit and len(cached) + missing >= limit
+    else:
+        usable = False
+
+    if usable:
+        fresh = exchange.fetch_ohlcv(symbol, timeframe, since=last_ts + 1, limit=missing + 1)
+        fresh = np.asarray(fresh, dtype=np.float64).reshape(-1, 6)
+        fresh = fresh[fresh[:, 0] > last_ts]
+        candles = np.concatenate((cached, fresh))
+    else:
+        fetched = exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
+        candles = np.asarray(fetched, dtype=np.float64).reshape(-1, 6)
+
+    closed = candles[:-1]
+    if len(closed) > len(cached) or not usable:
+        # The cache is best-effort; a failed write must not fail the request
+        try:
+            _store(path, closed[-MAX_CACHED_CANDLES:])
+        except OSError:
+            logger.exception("Error writing candle cache %s", path)
+
+    return candles[-limit:]
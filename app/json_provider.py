@@ -0,0 +1,26 @@
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson, serializing numpy arrays natively"""
+
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj, **kwargs):
+        """
+        Serialize obj with orjson
+
+        Honors sort_keys (defaulting to the provider's setting) and indent,
+        which orjson only supports as two spaces. Other json.dumps arguments
+        such as separators and ensure_ascii are ignored: output is always
+        compact UTF-8 unless indented.
+        """
+        option = self.option
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=kwargs.get('default', self.default), option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
@@ -1,18 +1,32 @@
 from flask import Blueprint, jsonify, request
 import ccxt
-from datetime import datetime, timedelta
+import logging
+import threading
+import time
+import numpy as np
+from app.core.ohlcv_cache import load_or_fetch
 
 chart_bp = Blueprint('chart', __name__)
+logger = logging.getLogger(__name__)
+
+_exchange = None
+_exchange_lock = threading.Lock()
 
 def get_exchange():
-    exchange = ccxt.binance({
-        'enableRateLimit': True,
-        'options': {
-            'defaultType': 'future'
-        }
-    })
-    exchange.set_sandbox_mode(True)
-    return exchange
+    # Share one client across requests so its session and rate limiter persist
+    global _exchange
+    if _exchange is None:
+        with _exchange_lock:
+            if _exchange is None:
+                exchange = ccxt.binance({
+                    'enableRateLimit': True,
+                    'options': {
+                        'defaultType': 'future'
+                    }
+                })
+                exchange.set_sandbox_mode(True)
+                _exchange = exchange
+    return _exchange
 
 TIMEFRAME_MAPPING = {
     '1m': '1m',
@@ -26,39 +40,66 @@ TIMEFRAME_MAPPING = {
     '6h': '6h',
     '8h': '8h',
     '12h': '12h',
-    '1d': '1D',
-    '3d': '3D',
-    '1w': '1W',
+    '1d': '1d',
+    '3d': '3d',
+    '1w': '1w',
     '1M': '1M'
 }
 
 QUOTE_CURRENCIES = ['USDT', 'BUSD', 'USDC', 'BTC', 'ETH']
 
+OHLCV_COLUMNS = ('time', 'open', 'high', 'low', 'close', 'volume')
+
+# Markets change rarely; a background thread rebuilds the symbol index
+# once per TTL so requests never wait on load_markets after the first one
+SYMBOLS_TTL = 3600
+
+_symbol_index = None
+_symbol_index_lock = threading.Lock()
+
+def build_symbol_index():
+    markets = get_exchange().load_markets(reload=True)
+    
+    # Organize symbols by base/quote currency
+    quotes = frozenset(QUOTE_CURRENCIES)
+    symbols = {}
+    for market in markets.values():
+        if market['active'] and market['future'] and market['quote'] in quotes:
+            symbols.setdefault(market['base'], []).append(market['quote'])
+    
+    return {
+        'bases': list(symbols.keys()),
+        'quotes': QUOTE_CURRENCIES,
+        'pairs': symbols
+    }
+
+def _refresh_symbol_index():
+    global _symbol_index
+    while True:
+        time.sleep(SYMBOLS_TTL)
+        try:
+            _symbol_index = build_symbol_index()
+        except Exception as e:
+            # Keep serving the previous index until the next attempt
+            logger.warning("Error refreshing symbol index: %s", e)
+
+def get_symbol_index():
+    global _symbol_index
+    if _symbol_index is None:
+        with _symbol_index_lock:
+            if _symbol_index is None:
+                _symbol_index = build_symbol_index()
+                # Started lazily so each gunicorn worker runs its own refresher after fork
+                threading.Thread(target=_refresh_symbol_index, name='symbol-index-refresher', daemon=True).start()
+    return _symbol_index
+
 @chart_bp.route('/symbols')
 def get_symbols():
     try:
-        exchange = get_exchange()
-        markets = exchange.load_markets()
-        
-        # Organize symbols by base/quote currency
-        symbols = {}
-        for symbol, market in markets.items():
-            if market['active'] and market['future']:
-                base = market['base']
-                quote = market['quote']
-                if quote in QUOTE_CURRENCIES:
-                    if base not in symbols:
-                        symbols[base] = []
-                    symbols[base].append(quote)
-        
         # Return structured symbol data
-        return jsonify({
-            'bases': list(symbols.keys()),
-            'quotes': QUOTE_CURRENCIES,
-            'pairs': symbols
-        })
+        return jsonify(get_symbol_index())
     except Exception as e:
-        print(f"Error fetching symbols: {str(e)}")
+        logger.exception("Error fetching symbols")
         return jsonify({'error': str(e)}), 500
 
 @chart_bp.route('/historical_data')
@@ -70,27 +111,26 @@ def get_historical_data():
         timeframe = request.args.get('timeframe', '1h')
         limit = int(request.args.get('limit', 1000))
         
-        print(f"Fetching data for {symbol} ({timeframe})")
+        logger.debug("Fetching data for %s (%s)", symbol, timeframe)
         
-        if timeframe not in TIMEFRAME_MAPPING:
+        exchange_timeframe = TIMEFRAME_MAPPING.get(timeframe)
+        if exchange_timeframe is None:
             return jsonify({'error': 'Invalid timeframe'}), 400
             
-        ohlcv = exchange.fetch_ohlcv(symbol, TIMEFRAME_MAPPING[timeframe], limit=limit)
+        candles = load_or_fetch(exchange, symbol, exchange_timeframe, limit)
         
-        formatted_data = [{
-            'time': candle[0] / 1000,
-            'open': candle[1],
-            'high': candle[2],
-            'low': candle[3],
-            'close': candle[4],
-            'volume': candle[5]
-        } for candle in ohlcv]
+        # Columnar payload: one vectorized pass instead of a dict per candle.
+        # Rows of the transposed copy are contiguous, so the JSON provider
+        # serializes them directly.
+        columns = np.ascontiguousarray(candles.T)
+        columns[0] *= 1e-3
+        formatted_data = dict(zip(OHLCV_COLUMNS, columns))
         
-        print(f"Fetched {len(formatted_data)} candles")
+        logger.debug("Fetched %d candles", len(candles))
         return jsonify(formatted_data)
         
     except Exception as e:
-        print(f"Error fetching historical data: {str(e)}")
+        logger.exception("Error fetching historical data")
         return jsonify({'error': str(e)}), 500
 
 @chart_bp.route('/timeframes')
@@ -1,12 +1,13 @@
 from flask import Blueprint, render_template
+import logging
 import os
 
 main_bp = Blueprint('main', __name__)
+logger = logging.getLogger(__name__)
 
 @main_bp.route('/')
 def index():
-    print("Rendering base template...")
-    template_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../templates/base.html'))
-    print(f"Template path: {template_path}")
-    print(f"Template exists: {os.path.exists(template_path)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        template_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../templates/base.html'))
+        logger.debug("Rendering base template %s (exists: %s)", template_path, os.path.exists(template_path))
     return render_template('base.html')
\ No newline at end of file
@@ -73,13 +73,22 @@ class TradingChart {
     async loadData() {
         try {
             const response = await fetch(`/api/historical_data?symbol=${this.currentSymbol}&timeframe=${this.currentTimeframe}`);
-            const data = await response.json();
+            const payload = await response.json();
             
-            if (Array.isArray(data)) {
+            if (payload && Array.isArray(payload.time)) {
+                // The API returns columns; the chart wants one object per candle
+                const data = payload.time.map((time, i) => ({
+                    time,
+                    open: payload.open[i],
+                    high: payload.high[i],
+                    low: payload.low[i],
+                    close: payload.close[i],
+                    volume: payload.volume[i]
+                }));
                 console.log('Received data:', data.slice(0, 2), '... (first 2 of', data.length, 'entries)');
                 this.candleSeries.setData(data);
             } else {
-                console.error('Invalid data format received:', data);
+                console.error('Invalid data format received:', payload);
             }
         } catch (error) {
             console.error('Error loading data:', error);
@@ -0,0 +1,15 @@
+import multiprocessing
+import os
+
+# Loopback only by default; set GUNICORN_BIND to expose the app deliberately
+bind = os.getenv('GUNICORN_BIND', '127.0.0.1:5000')
+
+# Load the app once in the master so config and routes are shared copy-on-write
+preload_app = True
+
+workers = int(os.getenv('GUNICORN_WORKERS', multiprocessing.cpu_count()))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', 4))
+
+# Heartbeat files on tmpfs instead of disk where available (not on macOS)
+worker_tmp_dir = os.getenv('GUNICORN_WORKER_TMP_DIR', '/dev/shm' if os.path.isdir('/dev/shm') else None)
@@ -1,9 +1,12 @@
 from app import create_app
 import os
 
-app = create_app()
+def get_app():
+    # Build the app on demand so importing this module stays cheap
+    return create_app()
 
 if __name__ == '__main__':
+    app = get_app()
     print("Current working directory:", os.getcwd())
     print("App template folder:", app.template_folder)
     print("App static folder:", app.static_folder)
@@ -0,0 +1,39 @@
+import ccxt
+import pytest
+from app import create_app
+from app.core import ohlcv_cache
+from app.routes import chart
+
+@pytest.fixture
+def exchange(monkeypatch, tmp_path):
+    # A real client, so timeframe parsing goes through ccxt; only the network call is stubbed
+    exchange = ccxt.binance()
+
+    def fetch_ohlcv(symbol, timeframe, since=None, limit=None):
+        assert timeframe in exchange.timeframes
+        bar_ms = exchange.parse_timeframe(timeframe) * 1000
+        return [[i * bar_ms, 1.0, 2.0, 0.5, 1.5, 10.0] for i in range(1, 4)]
+
+    monkeypatch.setattr(exchange, 'fetch_ohlcv', fetch_ohlcv)
+    monkeypatch.setattr(chart, 'get_exchange', lambda: exchange)
+    monkeypatch.setattr(ohlcv_cache, 'CACHE_DIR', str(tmp_path))
+    return exchange
+
+@pytest.fixture
+def client():
+    return create_app(skip_exchange=True).test_client()
+
+def test_every_advertised_timeframe_serves_candles(client, exchange):
+    timeframes = client.get('/api/timeframes').get_json()
+    assert timeframes == list(chart.TIMEFRAME_MAPPING)
+
+    for timeframe in timeframes:
+        response = client.get(f'/api/historical_data?symbol=BTC/USDT&timeframe={timeframe}&limit=3')
+        assert response.status_code == 200, timeframe
+        payload = response.get_json()
+        assert set(payload) == set(chart.OHLCV_COLUMNS)
+        assert len(payload['time']) == 3
+
+def test_unknown_timeframe_is_rejected(client, exchange):
+    response = client.get('/api/historical_data?timeframe=7m')
+    assert response.status_code == 400
@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+from app.core import grid_strategy
+from app.core.grid_strategy import GridStrategy
+
+@pytest.fixture(autouse=True)
+def ticker(monkeypatch):
+    monkeypatch.setattr(grid_strategy, 'get_exchange', lambda: None)
+    monkeypatch.setattr(grid_strategy, 'fetch_ticker', lambda symbol: {'last': '100.0'})
+
+def make_strategy(**trading):
+    config = {'trading': {'symbol': 'BTC/USDT', 'grid_size': 5, 'position_size': 0.01}}
+    config['trading'].update(trading)
+    return GridStrategy(config)
+
+def test_default_bounds_span_ten_percent_around_price():
+    levels = make_strategy().calculate_grid_levels()
+
+    assert levels['current_price'] == 100.0
+    np.testing.assert_allclose(levels['prices'], [90.0, 95.0, 100.0, 105.0, 110.0])
+    np.testing.assert_array_equal(levels['sizes'], np.full(5, 0.01))
+
+def test_configured_bounds_are_used():
+    levels = make_strategy(lower_price=80, upper_price=120, grid_size=3).calculate_grid_levels()
+
+    np.testing.assert_allclose(levels['prices'], [80.0, 100.0, 120.0])
+    assert levels['sizes'].shape == (3,)
+
+def test_single_level_grid():
+    levels = make_strategy(grid_size=1).calculate_grid_levels()
+
+    np.testing.assert_allclose(levels['prices'], [90.0])
+    np.testing.assert_array_equal(levels['sizes'], [0.01])
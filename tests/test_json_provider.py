@@ -0,0 +1,33 @@
+import numpy as np
+from flask import Flask
+from app.json_provider import ORJSONProvider
+
+def make_provider():
+    app = Flask(__name__)
+    provider = ORJSONProvider(app)
+    app.json = provider
+    return app, provider
+
+def test_keys_are_sorted_by_default():
+    _, provider = make_provider()
+    assert provider.dumps({'b': 1, 'a': 2}) == '{"a":2,"b":1}'
+
+def test_sort_keys_can_be_disabled():
+    _, provider = make_provider()
+    provider.sort_keys = False
+    assert provider.dumps({'b': 1, 'a': 2}) == '{"b":1,"a":2}'
+
+def test_indent_is_honored():
+    _, provider = make_provider()
+    assert provider.dumps({'a': 1}, indent=2) == '{\n  "a": 1\n}'
+
+def test_numpy_arrays_serialize_natively():
+    _, provider = make_provider()
+    assert provider.dumps({'x': np.array([1.5, 2.0])}) == '{"x":[1.5,2.0]}'
+
+def test_debug_responses_are_pretty_printed():
+    app, _ = make_provider()
+    app.debug = True
+    with app.app_context():
+        body = app.json.response({'a': 1}).get_data(as_text=True)
+    assert body == '{\n  "a": 1\n}\n'
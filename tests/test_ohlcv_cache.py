@@ -0,0 +1,162 @@
+import types
+from datetime import datetime, timezone
+import numpy as np
+import pytest
+from app.core import ohlcv_cache
+
+BAR_MS = 60_000
+PAGE = ohlcv_cache.MAX_PAGE_CANDLES
+# Half-way through a bar, so the newest candle is still forming
+START_MS = 28_333_333 * BAR_MS + BAR_MS // 2
+
+class StubExchange:
+    """Serves a synthetic 1m series ending at the current bar, one page per call"""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.requests = []
+
+    def parse_timeframe(self, timeframe):
+        return BAR_MS // 1000
+
+    def fetch_ohlcv(self, symbol, timeframe, since=None, limit=None):
+        self.requests.append((since, limit))
+        limit = min(limit, PAGE)
+        current = self.clock.now_ms - self.clock.now_ms % BAR_MS
+        if since is None:
+            start = current - (limit - 1) * BAR_MS
+        else:
+            start = -(-since // BAR_MS) * BAR_MS
+        end = min(current, start + (limit - 1) * BAR_MS)
+        return [[ts, 1.0, 2.0, 0.5, 1.5, 10.0] for ts in range(start, end + 1, BAR_MS)]
+
+class Clock:
+    def __init__(self, now_ms):
+        self.now_ms = now_ms
+
+    def time_ns(self):
+        return self.now_ms * 1_000_000
+
+    def advance(self, bars):
+        self.now_ms += bars * BAR_MS
+
+@pytest.fixture
+def clock(monkeypatch, tmp_path):
+    clock = Clock(START_MS)
+    monkeypatch.setattr(ohlcv_cache, 'time', types.SimpleNamespace(time_ns=clock.time_ns))
+    monkeypatch.setattr(ohlcv_cache, 'CACHE_DIR', str(tmp_path))
+    return clock
+
+def stored(symbol='BTC/USDT', timeframe='1m'):
+    return np.load(ohlcv_cache._cache_path(symbol, timeframe))
+
+def current_bar(clock):
+    return clock.now_ms - clock.now_ms % BAR_MS
+
+def test_cold_cache_fetches_latest_and_persists_closed_only(clock):
+    exchange = StubExchange(clock)
+
+    candles = ohlcv_cache.load_or_fetch(exchange, 'BTC/USDT', '1m', 100)
+
+    assert exchange.requests == [(None, 100)]
+    assert candles.shape == (100, 6)
+    assert candles[-1, 0] == current_bar(clock)
+    # The forming candle is returned but never written
+    assert len(stored()) == 99
+    assert stored()[-1, 0] + BAR_MS <= clock.now_ms
+
+def test_warm_cache_fetches_only_the_tail(clock):
+    exchange = StubExchange(clock)
+    ohlcv_cache.load_or_fetch(exchange, 'BTC/USDT', '1m', 100)
+    last_cached = stored()[-1, 0]
+    clock.advance(3)
+
+    candles = ohlcv_cache.load_or_fetch(exchange, 'BTC/USDT', '1m', 100)
+
+    assert exchange.requests[-1] == (last_cached + 1, 5)
+    assert candles.shape == (100, 6)
+    assert candles[-1, 0] == current_bar(clock)
+    assert np.all(np.diff(candles[:, 0]) == BAR_MS)
+    assert len(stored()) == 102
+    assert stored()[-1, 0] + BAR_MS <= clock.now_ms
+
+def test_stale_cache_is_refetched_in_full(clock):
+    exchange = StubExchange(clock)
+    ohlcv_cache.load_or_fetch(exchange, 'BTC/USDT', '1m', 100)
+    clock.advance(500)
+
+    candles = ohlcv_cache.load_or_fetch(exchange, 'BTC/USDT', '1m', 100)
+
+    assert exchange.requests[-1] == (None, 100)
+    assert candles[-1, 0] == current_bar(clock)
+    assert len(stored()) == 99
+
+def test_limit_is_clamped_to_one_page(clock):
+    exchange = StubExchange(clock)
+    ohlcv_cache.load_or_fetch(exchange, 'BTC/USDT', '1m', 3000)
+    clock.advance(2000)
+
+    candles = ohlcv_cache.load_or_fetch(exchange, 'BTC/USDT', '1m', 3000)
+
+    # A gap longer than a page cannot be filled by one tail request
+    assert exchange.requests[-1] == (None, PAGE)
+    assert candles.shape == (PAGE, 6)
+    assert candles[-1, 0] == current_bar(clock)
+
+def test_cache_write_failure_still_returns_candles(clock, monkeypatch, tmp_path):
+    blocker = tmp_path / 'not-a-dir'
+    blocker.write_text('')
+    monkeypatch.setattr(ohlcv_cache, 'CACHE_DIR', str(blocker / 'cache'))
+    exchange = StubExchange(clock)
+
+    candles = ohlcv_cache.load_or_fetch(exchange, 'BTC/USDT', '1m', 100)
+
+    assert candles.shape == (100, 6)
+    assert candles[-1, 0] == current_bar(clock)
+
+def _ms(*date):
+    return int(datetime(*date, tzinfo=timezone.utc).timestamp() * 1000)
+
+class MonthlyStubExchange:
+    """Serves calendar-month candles whose close tracks the clock until the month ends"""
+
+    MONTHS = [_ms(2025, month, 1) for month in range(1, 13)] + [_ms(2026, month, 1) for month in range(1, 13)]
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.requests = []
+
+    def parse_timeframe(self, timeframe):
+        # ccxt treats a month as a fixed 30 days
+        return 30 * 86400
+
+    def fetch_ohlcv(self, symbol, timeframe, since=None, limit=None):
+        self.requests.append((since, limit))
+        now = self.clock.now_ms
+        rows = []
+        for start, end in zip(self.MONTHS, self.MONTHS[1:]):
+            if start > now:
+                break
+            # The close is the last moment traded so far in that month
+            rows.append([start, 1.0, 2.0, 0.5, float(min(now, end - 1)), 10.0])
+        if since is not None:
+            rows = [row for row in rows if row[0] >= since][:limit]
+        return rows[-limit:]
+
+def test_calendar_month_forming_candle_is_not_persisted(clock):
+    clock.now_ms = _ms(2026, 3, 31, 12)
+    exchange = MonthlyStubExchange(clock)
+
+    candles = ohlcv_cache.load_or_fetch(exchange, 'BTC/USDT', '1M', 12)
+
+    # March is 31 days long, so open + 30 days has passed but it is still forming
+    assert candles[-1, 0] == _ms(2026, 3, 1)
+    assert stored(timeframe='1M')[-1, 0] == _ms(2026, 2, 1)
+
+    clock.now_ms = _ms(2026, 4, 20)
+    candles = ohlcv_cache.load_or_fetch(exchange, 'BTC/USDT', '1M', 12)
+
+    march = candles[candles[:, 0] == _ms(2026, 3, 1)]
+    assert march[0, 4] == _ms(2026, 4, 1) - 1
+    assert candles[-1, 0] == _ms(2026, 4, 1)
+    assert stored(timeframe='1M')[-1, 0] == _ms(2026, 3, 1)